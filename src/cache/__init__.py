@@ -7,5 +7,6 @@ and interface for future Redis/SQLite extensions.
 
 from src.cache.base import CacheBackend
 from src.cache.memory import InMemoryCache
+from src.cache.redis import RedisCache
 
-__all__ = ["CacheBackend", "InMemoryCache"]
+__all__ = ["CacheBackend", "InMemoryCache", "RedisCache"]
@@ -24,7 +24,7 @@ class CacheEntry:
         """Check if this entry has expired."""
         if self.expires_at is None:
             return False
-        return time.time() > self.expires_at
+        return time.monotonic() > self.expires_at
 
 
 @dataclass
@@ -134,7 +134,9 @@ class InMemoryCache(CacheBackend):
         If max_size is set and cache is full, oldest entries are evicted.
         """
         ttl = ttl if ttl is not None else self._default_ttl
-        expires_at = time.time() + ttl if ttl > 0 else None
+        # Monotonic expiry: immune to wall-clock jumps (NTP, DST) and
+        # slightly cheaper to read than time.time on most platforms
+        expires_at = time.monotonic() + ttl if ttl > 0 else None
 
         async with self._lock:
             # Evict oldest if at capacity
@@ -0,0 +1,132 @@
+"""
+Redis cache backend implementation.
+
+Shared, persistent cache for production deployments: survives stdio
+restarts (Claude Desktop restarts often) and is shared across replicas,
+so repeat queries hit Redis instead of re-spending GitHub rate limit.
+
+Requires the optional `redis` package (pip install skyll[redis]) and a
+reachable Redis instance.
+"""
+
+import json
+import logging
+from typing import Any
+
+try:
+    import orjson  # ~3-6x faster than stdlib json for large payloads
+except ImportError:  # optional speedup; stdlib json works fine
+    orjson = None
+
+from src.cache.base import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+
+class RedisCache(CacheBackend):
+    """
+    Redis-backed cache with TTL support.
+
+    Values are serialized as JSON, so only JSON-compatible values can be
+    cached (which covers the skill-content dicts the service stores).
+    Expiration is delegated to Redis via per-key TTLs.
+
+    Args:
+        url: Redis connection URL (default: redis://localhost:6379/0)
+        default_ttl: Default time-to-live in seconds (default: 1 hour)
+        key_prefix: Prefix applied to all keys to namespace the cache
+
+    Example:
+        cache = RedisCache("redis://localhost:6379/0", default_ttl=3600)
+        await cache.set("key", {"data": "value"})
+        result = await cache.get("key")
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379/0",
+        default_ttl: int = 3600,
+        key_prefix: str = "skyll:",
+    ):
+        try:
+            import redis.asyncio as redis
+        except ImportError as e:
+            raise ImportError(
+                "RedisCache requires the 'redis' package: pip install skyll[redis]"
+            ) from e
+
+        self._redis = redis.from_url(url, decode_responses=True)
+        self._default_ttl = default_ttl
+        self._key_prefix = key_prefix
+        # Local counters (per-process; Redis itself is shared)
+        self._hits = 0
+        self._misses = 0
+        self._sets = 0
+        self._deletes = 0
+
+    def _key(self, key: str) -> str:
+        return f"{self._key_prefix}{key}"
+
+    async def stop(self) -> None:
+        """Close the Redis connection."""
+        await self._redis.aclose()
+
+    async def get(self, key: str) -> Any | None:
+        """
+        Retrieve a value from cache.
+
+        Returns None if the key doesn't exist or has expired
+        (Redis evicts expired keys itself).
+        """
+        raw = await self._redis.get(self._key(key))
+        if raw is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return orjson.loads(raw) if orjson else json.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
+        """Store a value in cache with optional TTL."""
+        ttl = ttl if ttl is not None else self._default_ttl
+        await self._redis.set(
+            self._key(key),
+            orjson.dumps(value) if orjson else json.dumps(value),
+            ex=ttl if ttl > 0 else None,
+        )
+        self._sets += 1
+
+    async def delete(self, key: str) -> bool:
+        """Remove a specific key from cache."""
+        deleted = await self._redis.delete(self._key(key))
+        if deleted:
+            self._deletes += 1
+        return bool(deleted)
+
+    async def exists(self, key: str) -> bool:
+        """Check if key exists and is not expired."""
+        return bool(await self._redis.exists(self._key(key)))
+
+    async def clear(self) -> None:
+        """Remove all entries under this cache's key prefix."""
+        async for batch_key in self._redis.scan_iter(f"{self._key_prefix}*"):
+            await self._redis.delete(batch_key)
+
+    async def stats(self) -> dict[str, Any]:
+        """
+        Get cache performance statistics.
+
+        Hit/miss/set/delete counters are per-process; size reflects the
+        whole Redis database.
+        """
+        total_gets = self._hits + self._misses
+        hit_rate = (self._hits / total_gets * 100) if total_gets > 0 else 0.0
+
+        return {
+            "backend": "redis",
+            "size": await self._redis.dbsize(),
+            "hits": self._hits,
+            "misses": self._misses,
+            "sets": self._sets,
+            "deletes": self._deletes,
+            "hit_rate": round(hit_rate, 2),
+        }
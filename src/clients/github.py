@@ -66,6 +66,9 @@ class GitHubClient:
     Args:
         timeout: Request timeout in seconds (default: 10.0)
         token: Optional GitHub personal access token for higher rate limits
+        client: Optional shared httpx.AsyncClient. When provided, the
+                caller owns its lifecycle (it is not closed on exit) and
+                connection pooling is shared with other components.
     
     Example:
         async with GitHubClient(token="ghp_xxx") as client:
@@ -89,37 +92,56 @@ class GitHubClient:
     REPO_CACHE_TTL = 3600  # Refresh repo trees after 1 hour
     REPO_CACHE_ERROR_TTL = 300  # Retry failed repo fetches after 5 min
 
+    # Reference fetch caps: some skills ship 10+ markdown files of several
+    # KB each, which blows up both fetch latency and response size
+    MAX_REFERENCE_FILES = 20  # Fetch at most this many reference files
+    MAX_REFERENCE_BYTES = 200_000  # Cumulative content cap across references
+    REFERENCE_FETCH_CONCURRENCY = 8  # Parallel raw-content fetches per skill
+
     def __init__(
         self,
         timeout: float = 10.0,
         token: str | None = None,
+        client: httpx.AsyncClient | None = None,
     ):
         self._timeout = timeout
         self._token = token
+        self._external_client = client
         self._client: httpx.AsyncClient | None = None
-        # Cache: {source: {"data": dict|None, "cached_at": float}}
-        self._repo_cache: dict[str, dict] = {}
-
-    async def __aenter__(self) -> "GitHubClient":
-        """Enter async context, creating HTTP client."""
-        headers = {
+        self._headers = {
             "Accept": "application/vnd.github.v3+json",
             "User-Agent": "skyll/0.1.0",
         }
-        if self._token:
-            headers["Authorization"] = f"token {self._token}"
+        if token:
+            self._headers["Authorization"] = f"token {token}"
+        # Cache: {source: {"data": dict|None, "cached_at": float}}
+        self._repo_cache: dict[str, dict] = {}
+        # Client-wide bound on parallel reference fetches: a per-call bound
+        # would multiply by the number of skills fetched concurrently and
+        # trip GitHub's secondary rate limiter
+        self._ref_semaphore = asyncio.Semaphore(self.REFERENCE_FETCH_CONCURRENCY)
+        # Last X-RateLimit-Remaining seen on an API response (None until
+        # the first API call); surfaced through service cache stats
+        self.rate_limit_remaining: int | None = None
+        # Repos with an in-flight background tree revalidation, plus strong
+        # references to the tasks themselves — the event loop only keeps
+        # weak refs, so an unanchored task can be garbage-collected mid-run
+        self._tree_refreshing: set[str] = set()
+        self._refresh_tasks: set[asyncio.Task] = set()
 
-        self._client = httpx.AsyncClient(
-            timeout=self._timeout,
-            headers=headers,
-        )
+    async def __aenter__(self) -> "GitHubClient":
+        """Enter async context, creating HTTP client if none was injected."""
+        if self._external_client is not None:
+            self._client = self._external_client
+        else:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        """Exit async context, closing HTTP client."""
-        if self._client:
+        """Exit async context, closing the HTTP client if we own it."""
+        if self._client and self._external_client is None:
             await self._client.aclose()
-            self._client = None
+        self._client = None
 
     @property
     def client(self) -> httpx.AsyncClient:
@@ -131,12 +153,22 @@ class GitHubClient:
             )
         return self._client
 
+    def _track_rate_limit(self, response: httpx.Response) -> None:
+        """Record the rate-limit budget GitHub reported on an API response."""
+        remaining = response.headers.get("X-RateLimit-Remaining")
+        if remaining is not None:
+            try:
+                self.rate_limit_remaining = int(remaining)
+            except ValueError:
+                pass
+
     async def _get_default_branch(self, source: str) -> str | None:
         """Get the default branch for a repository."""
         url = f"{self.API_BASE_URL}/repos/{source}"
-        
+
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=self._headers)
+            self._track_rate_limit(response)
             if response.status_code == 200:
                 data = response.json()
                 return data.get("default_branch", "main")
@@ -153,9 +185,12 @@ class GitHubClient:
     async def _get_repo_tree(self, source: str) -> dict | None:
         """
         Get the full file tree and default branch for a repository.
-        
+
         Returns a dict with 'branch' and 'tree' (all files), or None if failed.
-        Cached per repo with TTL.
+        Cached per repo with TTL; an expired tree is served stale while a
+        single background task refreshes it, so callers never block on the
+        TTL boundary (failed fetches are still retried inline after their
+        shorter error TTL).
         """
         entry = self._repo_cache.get(source)
         if entry is not None:
@@ -163,8 +198,33 @@ class GitHubClient:
             ttl = self.REPO_CACHE_TTL if entry["data"] is not None else self.REPO_CACHE_ERROR_TTL
             if age < ttl:
                 return entry["data"]
+            if entry["data"] is not None:
+                # Stale-while-revalidate: hand back the expired tree and
+                # refresh it off the caller's critical path
+                if source not in self._tree_refreshing:
+                    self._tree_refreshing.add(source)
+                    task = asyncio.create_task(self._refresh_repo_tree(source))
+                    self._refresh_tasks.add(task)
+
+                    def _on_refresh_done(t: asyncio.Task, s: str = source) -> None:
+                        self._tree_refreshing.discard(s)
+                        self._refresh_tasks.discard(t)
+
+                    task.add_done_callback(_on_refresh_done)
+                return entry["data"]
             del self._repo_cache[source]
 
+        return await self._fetch_repo_tree(source)
+
+    async def _refresh_repo_tree(self, source: str) -> None:
+        """Background revalidation of an expired repo tree (errors logged only)."""
+        try:
+            await self._fetch_repo_tree(source)
+        except Exception as e:
+            logger.warning(f"Background tree refresh failed for {source}: {e}")
+
+    async def _fetch_repo_tree(self, source: str) -> dict | None:
+        """Fetch a repo's tree from the API and store it in the cache."""
         now = time.monotonic()
 
         # First get the default branch
@@ -177,8 +237,9 @@ class GitHubClient:
         url = f"{self.API_BASE_URL}/repos/{source}/git/trees/{branch}?recursive=1"
         
         try:
-            response = await self.client.get(url)
-            
+            response = await self.client.get(url, headers=self._headers)
+            self._track_rate_limit(response)
+
             if response.status_code != 200:
                 logger.warning(f"GitHub tree API returned {response.status_code} for {source}")
                 self._repo_cache[source] = {"data": None, "cached_at": now}
@@ -329,12 +390,60 @@ class GitHubClient:
         
         return reference_files
 
+    async def _fetch_references(
+        self,
+        source: str,
+        branch: str,
+        ref_files: list[tuple[str, str]],
+    ) -> list[ReferenceFile]:
+        """
+        Fetch reference file contents with bounded concurrency and size caps.
+
+        Fetches at most MAX_REFERENCE_FILES files, REFERENCE_FETCH_CONCURRENCY
+        at a time, and truncates content once the cumulative size exceeds
+        MAX_REFERENCE_BYTES so a single skill can't blow up the payload.
+        """
+        if len(ref_files) > self.MAX_REFERENCE_FILES:
+            logger.debug(
+                f"Capping references for {source}: "
+                f"{len(ref_files)} found, fetching {self.MAX_REFERENCE_FILES}"
+            )
+            ref_files = ref_files[: self.MAX_REFERENCE_FILES]
+
+        async def fetch_ref(name: str, path: str) -> ReferenceFile:
+            async with self._ref_semaphore:
+                ref_content = await self._fetch_raw_content(source, branch, path)
+            return ReferenceFile(
+                name=name,
+                path=path,
+                content=ref_content,
+                raw_url=f"{self.RAW_BASE_URL}/{source}/{branch}/{path}",
+            )
+
+        references = list(await asyncio.gather(*[
+            fetch_ref(name, path) for name, path in ref_files
+        ]))
+
+        # Enforce the cumulative size budget in order, truncating the first
+        # reference that overflows it and emptying the rest
+        budget = self.MAX_REFERENCE_BYTES
+        for ref in references:
+            if not ref.content:
+                continue
+            if len(ref.content) <= budget:
+                budget -= len(ref.content)
+            else:
+                ref.content = ref.content[:budget] + "...[truncated]"
+                budget = 0
+
+        return references
+
     async def _fetch_raw_content(self, source: str, branch: str, path: str) -> str | None:
         """Fetch raw file content from GitHub."""
         url = f"{self.RAW_BASE_URL}/{source}/{branch}/{path}"
         
         try:
-            response = await self.client.get(url)
+            response = await self.client.get(url, headers=self._headers)
             if response.status_code == 200:
                 return response.text
             return None
@@ -414,11 +523,7 @@ class GitHubClient:
                     if include_references:
                         ref_files = self._find_reference_files(all_paths, skill_dir)
                         if ref_files:
-                            async def fetch_ref(name: str, path: str) -> ReferenceFile:
-                                ref_content = await self._fetch_raw_content(source, branch, path)
-                                ref_url = f"{self.RAW_BASE_URL}/{source}/{branch}/{path}"
-                                return ReferenceFile(name=name, path=path, content=ref_content, raw_url=ref_url)
-                            references = list(await asyncio.gather(*[fetch_ref(n, p) for n, p in ref_files]))
+                            references = await self._fetch_references(source, branch, ref_files)
                     return FetchResult(content=content, raw_url=raw_url, skill_dir=skill_dir, references=references)
             
             return FetchResult(
@@ -448,21 +553,7 @@ class GitHubClient:
             
             if ref_files:
                 logger.debug(f"Found {len(ref_files)} reference files for {skill_id}")
-                
-                # Fetch all reference files in parallel
-                async def fetch_ref(name: str, path: str) -> ReferenceFile:
-                    ref_content = await self._fetch_raw_content(source, branch, path)
-                    ref_url = f"{self.RAW_BASE_URL}/{source}/{branch}/{path}"
-                    return ReferenceFile(
-                        name=name,
-                        path=path,
-                        content=ref_content,
-                        raw_url=ref_url,
-                    )
-                
-                references = await asyncio.gather(*[
-                    fetch_ref(name, path) for name, path in ref_files
-                ])
+                references = await self._fetch_references(source, branch, ref_files)
         
         return FetchResult(
             content=content,
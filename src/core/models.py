@@ -7,7 +7,7 @@ optimized for LLM consumption with clear, typed fields.
 
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, field_serializer
 
 
 class SkillReference(BaseModel):
@@ -155,6 +155,16 @@ class Skill(BaseModel):
         exclude=True,
     )
 
+    @field_serializer("relevance_score")
+    def _round_relevance_score(self, value: float) -> float:
+        """Round for display; internal ranking keeps full precision."""
+        return round(value, 2)
+
+    # Normalized-field cache populated lazily by RelevanceRanker so
+    # repeated ranking of the same instance doesn't redo string work.
+    # Not serialized; discarded with the instance.
+    _norm_cache: dict = PrivateAttr(default_factory=dict)
+
     @property
     def has_content(self) -> bool:
         """True if skill content was successfully fetched."""
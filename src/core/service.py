@@ -10,6 +10,9 @@ with automatic deduplication across sources.
 
 import asyncio
 import logging
+import os
+
+import httpx
 
 from src.cache import CacheBackend, InMemoryCache
 from src.clients import GitHubClient
@@ -41,6 +44,10 @@ class SkillSearchService:
         github_token: Optional GitHub token for higher rate limits
         cache_ttl: Cache time-to-live in seconds (default: 24 hours)
         enable_awesome_list: Enable the awesome-claude-skills source (default: True)
+        http_client: Optional shared httpx.AsyncClient with explicit pool
+                     limits. Injected into sources and the GitHub client so
+                     all outbound requests share one connection pool; the
+                     caller owns its lifecycle.
     
     Example:
         service = SkillSearchService()
@@ -57,6 +64,7 @@ class SkillSearchService:
         github_token: str | None = None,
         cache_ttl: int = 86400,  # 24 hours
         enable_registry: bool = True,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self._cache = cache or InMemoryCache(default_ttl=cache_ttl)
         self._ranker = ranker or RelevanceRanker()
@@ -64,6 +72,16 @@ class SkillSearchService:
         self._cache_ttl = cache_ttl
         self._parser = SkillParser()
         self._enable_registry = enable_registry
+        self._http_client = http_client
+
+        # Service-wide bound on concurrent GitHub fetches. Tool-level
+        # semaphores bound each tool separately, so several tools firing at
+        # once could still burst past GitHub's secondary rate limiter; this
+        # gate sits in front of every outbound GitHub fetch regardless of
+        # which tool triggered it.
+        self._github_semaphore = asyncio.Semaphore(
+            int(os.getenv("SKYLL_GH_CONCURRENCY", "8"))
+        )
 
         # Sources and clients are created in context manager
         self._sources: list[SkillSource] = []
@@ -73,14 +91,16 @@ class SkillSearchService:
         """Enter async context, initializing sources and clients."""
         # Initialize skill sources
         self._sources = [
-            SkillsShSource(enabled=True),
+            SkillsShSource(enabled=True, client=self._http_client),
         ]
         
         if self._enable_registry:
             self._sources.append(SkillRegistrySource(enabled=True))
         
         # Initialize GitHub client for content fetching
-        self._github_client = GitHubClient(token=self._github_token)
+        self._github_client = GitHubClient(
+            token=self._github_token, client=self._http_client
+        )
 
         # Enter all contexts
         for source in self._sources:
@@ -149,10 +169,11 @@ class SkillSearchService:
             logger.debug(f"Cache hit for {cache_key}")
             return cached.get("content"), cached.get("raw_url"), [], cached.get("error")
 
-        # Fetch from GitHub
-        result = await self._github_client.fetch_skill(
-            source, skill_id, include_references=include_references
-        )
+        # Fetch from GitHub (bounded service-wide to avoid rate-limit bursts)
+        async with self._github_semaphore:
+            result = await self._github_client.fetch_skill(
+                source, skill_id, include_references=include_references
+            )
 
         if result.success:
             # Cache successful fetch (content only)
@@ -317,17 +338,23 @@ class SkillSearchService:
         include_content: bool = True,
         include_raw: bool = False,
         include_references: bool = False,
+        on_skill=None,
     ) -> SearchResponse:
         """
         Search for skills matching a query across all sources.
-        
+
         Args:
             query: Search query (e.g., "react performance")
             limit: Maximum number of results (default: 10)
             include_content: Fetch full SKILL.md content (default: True)
             include_raw: Include raw content with frontmatter (default: False)
             include_references: Fetch reference files from references/ directory (default: False)
-            
+            on_skill: Optional async callback awaited as each candidate's
+                      content fetch completes, called with
+                      (skill, completed, total). Lets callers stream partial
+                      results while slower fetches are still in flight;
+                      callback errors are logged, not raised.
+
         Returns:
             SearchResponse with matching skills sorted by relevance
         """
@@ -347,17 +374,33 @@ class SkillSearchService:
             self._process_search_result(result, include_content, include_raw, include_references)
             for result in search_results
         ]
-        skills = await asyncio.gather(*tasks)
-
-        # Rank results with query relevance and reference availability
+        if on_skill is None:
+            skills = await asyncio.gather(*tasks)
+        else:
+            # Consume in completion order so the caller sees each skill as
+            # soon as its fetch finishes (ranking still happens below, over
+            # the full set)
+            skills = []
+            for completed, future in enumerate(asyncio.as_completed(tasks), start=1):
+                skill = await future
+                skills.append(skill)
+                try:
+                    await on_skill(skill, completed, len(tasks))
+                except Exception as e:
+                    logger.debug(f"on_skill callback failed (non-fatal): {e}")
+
+        # Rank results with query relevance and reference availability,
+        # selecting only the requested top-k from the over-fetched pool
         ranked_skills = self._ranker.rank(
             list(skills),
             query=query,
             include_references=include_references,
+            top_k=limit,
         )
-
-        # Trim to requested limit after ranking
-        ranked_skills = ranked_skills[:limit]
+        # Defensive trim: the limit contract must hold even for injected
+        # rankers that sort fully and ignore top_k
+        if len(ranked_skills) > limit:
+            ranked_skills = ranked_skills[:limit]
 
         return SearchResponse(
             query=query,
@@ -409,8 +452,13 @@ class SkillSearchService:
         return self._build_skill(search_result, parsed, raw_url, references, error, include_raw)
 
     async def get_cache_stats(self) -> dict:
-        """Get cache statistics."""
-        return await self._cache.stats()
+        """Get cache statistics, including the last-seen GitHub rate-limit budget."""
+        stats = await self._cache.stats()
+        if self._github_client is not None:
+            stats["github_rate_limit_remaining"] = (
+                self._github_client.rate_limit_remaining
+            )
+        return stats
     
     async def get_sources(self) -> list[dict]:
         """Get information about enabled sources."""
@@ -5,16 +5,29 @@ Main entry point for the FastAPI application.
 Provides both REST API and MCP (Model Context Protocol) endpoints.
 """
 
+import asyncio
+import json
 import logging
 import os
+import queue
 import sys
 from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+
+import httpx
+
+try:
+    import orjson  # ~3-6x faster than stdlib json for large payloads
+except ImportError:  # optional speedup; stdlib json works fine
+    orjson = None
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.datastructures import MutableHeaders
 
 from src.api.routes import router, set_service
+from src.cache import RedisCache
 from src.core.service import SkillSearchService
 from src.mcp_server import create_mcp_server
 import src.mcp_server as mcp_module
@@ -24,18 +37,47 @@ import src.mcp_server as mcp_module
 # Load environment variables from .env file
 load_dotenv()
 
-# Configure logging
+# Configure logging through a queue so stdout writes happen on a background
+# thread instead of inside request handlers. A synchronous StreamHandler holds
+# the GIL and the stdout lock for the duration of each write, which serializes
+# otherwise-async request processing under load.
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_stream_handler = logging.StreamHandler(sys.stdout)
+_log_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+)
+_log_listener = QueueListener(_log_queue, _log_stream_handler)
+
+# Pass-through formatter: QueueHandler.prepare() bakes its formatter's
+# output into the record, so anything beyond %(message)s here would be
+# formatted a second time by the listener-side handler above
+_log_queue_handler = QueueHandler(_log_queue)
+_log_queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+# force=True: importing src.mcp_server above already ran its import-time
+# basicConfig, and without force this call would be a silent no-op, leaving
+# logging synchronous on the request path
 logging.basicConfig(
     level=os.getenv("LOG_LEVEL", "INFO").upper(),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.StreamHandler(sys.stdout)],
+    handlers=[_log_queue_handler],
+    force=True,
 )
 logger = logging.getLogger(__name__)
 
 # Configuration from environment
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))
+REDIS_URL = os.getenv("REDIS_URL")
 ENABLE_REGISTRY = os.getenv("ENABLE_REGISTRY", "true").lower() == "true"
+HTTP_MAX_CONNECTIONS = int(os.getenv("SKYLL_HTTP_MAX_CONNECTIONS", "500"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("SKYLL_HTTP_MAX_KEEPALIVE", "100"))
+
+def _dump_json_bytes(obj) -> bytes:
+    """Serialize to compact JSON bytes, using orjson when available."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
 
 # Global service instance
 _service: SkillSearchService | None = None
@@ -47,7 +89,9 @@ _mcp_server = create_mcp_server()
 # Create MCP ASGI app with path="/mcp" - routes are included directly in the FastAPI app
 # (not mounted) to avoid Starlette's trailing slash redirect which breaks MCP clients.
 # stateless_http=True means each request creates a fresh context (no session affinity needed)
-_mcp_app = _mcp_server.http_app(path="/mcp", stateless_http=True)
+# json_response=False streams tool responses (SSE) instead of buffering the full
+# payload, which matters for large SKILL.md responses
+_mcp_app = _mcp_server.http_app(path="/mcp", stateless_http=True, json_response=False)
 
 
 @asynccontextmanager
@@ -63,13 +107,34 @@ async def lifespan(app: FastAPI):
     """
     global _service
 
+    # Start draining the log queue (records logged before this point are
+    # buffered and flushed here)
+    _log_listener.start()
+
     logger.info("Starting Skyll service...")
 
+    # One pooled HTTP client for all outbound requests, with explicit
+    # limits so concurrent search/fetch fan-out can't exhaust connections
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=30.0,
+        ),
+        timeout=httpx.Timeout(10.0, connect=5.0),
+    )
+
+    # Shared Redis cache when configured (survives restarts, shared
+    # across replicas); falls back to the in-process cache otherwise
+    cache = RedisCache(REDIS_URL, default_ttl=CACHE_TTL) if REDIS_URL else None
+
     # Initialize service with multi-source support
     _service = SkillSearchService(
+        cache=cache,
         github_token=GITHUB_TOKEN,
         cache_ttl=CACHE_TTL,
         enable_registry=ENABLE_REGISTRY,
+        http_client=http_client,
     )
 
     # Enter service context
@@ -81,21 +146,36 @@ async def lifespan(app: FastAPI):
     # Share service with MCP server (set module-level _service)
     mcp_module._service = _service
 
+    # Warm source caches in the background without delaying readiness
+    warmup_task = asyncio.create_task(mcp_module._warmup_service(_service))
+
     logger.info("Skyll service started successfully")
     logger.info(f"Cache TTL: {CACHE_TTL}s")
+    logger.info(f"Cache backend: {'redis' if REDIS_URL else 'in-memory'}")
     logger.info(f"GitHub token: {'configured' if GITHUB_TOKEN else 'not configured'}")
     logger.info(f"Skill registry: {'enabled' if ENABLE_REGISTRY else 'disabled'}")
     logger.info("MCP endpoint available at /mcp")
 
+    # Pre-generate and freeze the OpenAPI schema. FastAPI builds it lazily on
+    # the first /openapi.json hit by walking every route and model, which is
+    # slow now that the MCP routes are included. Building it once here (and
+    # pre-serializing to bytes) turns docs loads into a static read.
+    app.openapi_schema = app.openapi()
+    app.state.openapi_bytes = _dump_json_bytes(app.openapi_schema)
+
     # Enter MCP app's lifespan (initializes session manager)
     async with _mcp_app.lifespan(app):
         yield
 
     # Cleanup
     logger.info("Shutting down Skyll service...")
+    if not warmup_task.done():
+        warmup_task.cancel()
     if _service:
         await _service.__aexit__(None, None, None)
+    await http_client.aclose()
     logger.info("Skyll service stopped")
+    _log_listener.stop()
 
 
 # Create FastAPI application with combined lifespan
@@ -176,6 +256,34 @@ Each skill includes:
     lifespan=lifespan,
 )
 
+class _NoBufferMiddleware:
+    """
+    Disable proxy buffering for streamed /mcp responses.
+
+    Sets X-Accel-Buffering: no so reverse proxies forward SSE chunks as
+    they are produced instead of buffering the whole response, keeping
+    time-to-first-byte low for streaming MCP clients.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope.get("path", "").startswith("/mcp"):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Accel-Buffering"] = "no"
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+app.add_middleware(_NoBufferMiddleware)
+
 # Enable CORS for browser-based clients
 app.add_middleware(
     CORSMiddleware,
@@ -195,6 +303,25 @@ app.include_router(router)
 # MCP clients connect via https://api.skyll.app/mcp
 app.routes.extend(_mcp_app.routes)
 
+# Replace FastAPI's default /openapi.json handler (which re-serializes the
+# schema dict on every request) with one that returns the bytes blob frozen
+# during startup.
+app.router.routes = [
+    route for route in app.router.routes
+    if getattr(route, "path", None) != "/openapi.json"
+]
+
+
+@app.get("/openapi.json", include_in_schema=False)
+async def openapi_json() -> Response:
+    """Serve the pre-serialized OpenAPI schema."""
+    blob = getattr(app.state, "openapi_bytes", None)
+    if blob is None:
+        # Lifespan hasn't run yet (e.g. tests hitting the app directly)
+        blob = _dump_json_bytes(app.openapi())
+        app.state.openapi_bytes = blob
+    return Response(content=blob, media_type="application/json")
+
 
 def run():
     """Run the server (for CLI entry point)."""
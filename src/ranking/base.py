@@ -23,15 +23,19 @@ class Ranker(ABC):
         skills: list["Skill"],
         query: str = "",
         include_references: bool = False,
+        top_k: int | None = None,
     ) -> list["Skill"]:
         """
         Rank skills by relevance.
-        
+
         Args:
             skills: List of skills to rank
             query: Original search query for relevance scoring
             include_references: Whether references were requested (boosts skills with refs)
-            
+            top_k: If set, return only the k highest-scored skills
+                   (lets implementations use a partial selection instead
+                   of a full sort)
+
         Returns:
             Skills sorted by relevance_score (descending)
         """
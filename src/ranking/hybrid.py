@@ -39,11 +39,12 @@ class HybridRanker(Ranker):
         skills: list["Skill"],
         query: str = "",
         include_references: bool = False,
+        top_k: int | None = None,
     ) -> list["Skill"]:
         """
         Hybrid ranking combining popularity and semantic similarity.
-        
+
         MVP: Falls back to InstallCountRanker.
         Future: Will incorporate embedding-based semantic scores.
         """
-        return RelevanceRanker().rank(skills, query, include_references)
+        return RelevanceRanker().rank(skills, query, include_references, top_k=top_k)
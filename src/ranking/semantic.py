@@ -31,10 +31,11 @@ class SemanticRanker(Ranker):
         skills: list["Skill"],
         query: str = "",
         include_references: bool = False,
+        top_k: int | None = None,
     ) -> list["Skill"]:
         """
         Rank by semantic similarity to query.
-        
+
         NOT IMPLEMENTED - falls back to InstallCountRanker.
         """
-        return RelevanceRanker().rank(skills, query, include_references)
+        return RelevanceRanker().rank(skills, query, include_references, top_k=top_k)
@@ -5,9 +5,11 @@ Reads skills from the local SKILLS_REGISTRY.md file - a community-curated
 list of agent skills that's easy to parse and contribute to.
 """
 
+import heapq
 import logging
 import re
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
 
 from src.sources.base import SkillSearchResult
@@ -17,6 +19,13 @@ logger = logging.getLogger(__name__)
 # Path to the registry file (relative to project root)
 REGISTRY_FILE = Path(__file__).parent.parent.parent / "registry" / "SKILLS.md"
 
+# Registry parsing patterns, compiled once at import instead of per parse
+# Code blocks (to avoid parsing examples) and HTML comments are stripped
+# in one alternation pass instead of two full-string copies
+_STRIP_RE = re.compile(r'```[\s\S]*?```|<!--[\s\S]*?-->')
+# Category header line: '## <optional emoji/punctuation> Name'
+_CATEGORY_LINE_RE = re.compile(r'##\s+[^\w]*(.+)')
+
 
 @dataclass
 class RegistrySkill:
@@ -27,6 +36,23 @@ class RegistrySkill:
     path: str | None
     description: str
     category: str
+    # Lowercased fields, derived once at load time so _match_query doesn't
+    # re-lowercase every skill on every query
+    id_lower: str = field(init=False)
+    desc_lower: str = field(init=False)
+    cat_lower: str = field(init=False)
+    searchable: str = field(init=False)
+    words: frozenset[str] = field(init=False)
+    # Prebuilt search result shared across queries (every field is static
+    # per entry; consumers treat results as read-only)
+    result: "SkillSearchResult | None" = field(default=None, init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.id_lower = self.id.lower()
+        self.desc_lower = self.description.lower()
+        self.cat_lower = self.category.lower()
+        self.searchable = f"{self.id_lower} {self.desc_lower} {self.cat_lower}"
+        self.words = frozenset(self.searchable.replace("-", " ").split())
 
 
 class SkillRegistrySource:
@@ -56,8 +82,7 @@ class SkillRegistrySource:
         return self._enabled
     
     async def __aenter__(self) -> "SkillRegistrySource":
-        """Load the registry on startup."""
-        self._load_registry()
+        """Enter async context (registry loads lazily on first search)."""
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -91,46 +116,56 @@ class SkillRegistrySource:
         skills = []
         current_category = "General"
         
-        # Remove code blocks to avoid parsing examples
-        content_no_code = re.sub(r'```[\s\S]*?```', '', content)
-        # Remove HTML comments
-        content_no_code = re.sub(r'<!--[\s\S]*?-->', '', content_no_code)
-        
-        # Pattern for category headers
-        category_pattern = re.compile(r'^##\s+[^\w]*(.+)$', re.MULTILINE)
-        
-        # Pattern for skill entries: - id | owner/repo | path | description
-        skill_pattern = re.compile(
-            r'^-\s+([^|]+)\s*\|\s*([^/]+)/([^|]+)\s*\|\s*([^|]*)\s*\|\s*(.+)$',
-            re.MULTILINE
-        )
-        
-        # Find categories and their positions
-        categories = [(m.start(), m.group(1).strip()) for m in category_pattern.finditer(content_no_code)]
-        
-        for match in skill_pattern.finditer(content_no_code):
-            pos = match.start()
-            
-            # Find which category this skill belongs to
-            for cat_pos, cat_name in reversed(categories):
-                if pos > cat_pos:
-                    current_category = cat_name
-                    break
-            
-            skill_id = match.group(1).strip()
-            owner = match.group(2).strip()
-            repo = match.group(3).strip()
-            path = match.group(4).strip() or None
-            description = match.group(5).strip()
+        # Remove code blocks and HTML comments in a single pass
+        content_no_code = _STRIP_RE.sub('', content)
+
+        # One linear pass over the lines: headers update the running
+        # category, entry lines are split on their pipes directly — a tight
+        # C-level str.split instead of a backtracking multi-group regex
+        for line in content_no_code.splitlines():
+            if line.startswith('## '):
+                header = _CATEGORY_LINE_RE.match(line)
+                if header:
+                    current_category = header.group(1).strip()
+                continue
+
+            if not line.startswith('- '):
+                continue
+
+            # Entry format: - id | owner/repo | path | description
+            # (maxsplit keeps any literal pipes inside the description)
+            parts = line[2:].split('|', 3)
+            if len(parts) != 4 or not parts[3]:
+                continue
+
+            source_part = parts[1].strip()
+            if '/' not in source_part:
+                continue
+            owner, _, repo = source_part.partition('/')
+
+            skill_id = parts[0].strip()
+            owner = owner.strip()
+            repo = repo.strip()
+            path = parts[2].strip() or None
+            description = parts[3].strip()
             
-            skills.append(RegistrySkill(
+            skill = RegistrySkill(
                 id=skill_id,
                 owner=owner,
                 repo=repo,
                 path=path,
                 description=description,
                 category=current_category,
-            ))
+            )
+            skill.result = SkillSearchResult(
+                id=skill.id,
+                name=skill.id,
+                source=f"{skill.owner}/{skill.repo}",
+                source_registry=self.REGISTRY_NAME,
+                installs=0,
+                description=skill.description,
+            )
+            skills.append(skill)
         
         return skills
     
@@ -142,27 +177,39 @@ class SkillRegistrySource:
         """
         query_lower = query.lower()
         query_terms = query_lower.split()
-        
-        # Check ID match
-        id_lower = skill.id.lower()
-        if query_lower == id_lower:
+
+        # Empty queries match nothing (without this, "" is a substring of
+        # every ID and would score 0.9 across the board)
+        if not query_terms:
+            return 0.0
+
+        # Fast reject for single-token queries: every scoring tier below
+        # implies the token appears somewhere in the searchable blob, so
+        # one scan rules out most non-matching skills (multi-token queries
+        # can still match term-by-term, so they skip this). Test the split
+        # term, not query_lower — the raw query may carry surrounding
+        # whitespace that the term tier would have tolerated.
+        if len(query_terms) == 1 and query_terms[0] not in skill.searchable:
+            return 0.0
+
+        # Check ID match (lowercased fields are precomputed at load time)
+        if query_lower == skill.id_lower:
             return 1.0
-        if query_lower in id_lower:
+        if query_lower in skill.id_lower:
             return 0.9
-        
+
         # Check description match
-        desc_lower = skill.description.lower()
-        if query_lower in desc_lower:
+        if query_lower in skill.desc_lower:
             return 0.7
-        
+
         # Check category match
-        cat_lower = skill.category.lower()
-        if query_lower in cat_lower:
+        if query_lower in skill.cat_lower:
             return 0.5
-        
-        # Check individual terms
-        searchable = f"{id_lower} {desc_lower} {cat_lower}"
-        matches = sum(1 for term in query_terms if term in searchable)
+
+        # Check individual terms (whole-word set lookups, not substring
+        # scans — also avoids false positives like "search" in "research")
+        words = skill.words
+        matches = sum(1 for term in query_terms if term in words)
         if matches > 0:
             return 0.3 * (matches / len(query_terms))
         
@@ -186,24 +233,12 @@ class SkillRegistrySource:
             if score > 0:
                 scored_skills.append((score, skill))
         
-        # Sort by score descending
-        scored_skills.sort(key=lambda x: x[0], reverse=True)
-        
-        # Convert to results
-        results = []
-        for score, skill in scored_skills[:limit]:
-            source = f"{skill.owner}/{skill.repo}"
-            
-            results.append(
-                SkillSearchResult(
-                    id=skill.id,
-                    name=skill.id,
-                    source=source,
-                    source_registry=self.REGISTRY_NAME,
-                    installs=0,
-                    description=skill.description,
-                )
-            )
+        # Select the top `limit` by score — O(N log k) instead of sorting
+        # everything only to slice
+        top_skills = heapq.nlargest(limit, scored_skills, key=itemgetter(0))
+
+        # Results are prebuilt at parse time — just collect them
+        results = [skill.result for score, skill in top_skills]
         
         logger.debug(f"registry: '{query}' returned {len(results)} results")
         return results
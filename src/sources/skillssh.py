@@ -8,9 +8,16 @@ Website: https://skills.sh
 """
 
 import logging
+import time
+from collections import OrderedDict
 
 import httpx
 
+try:
+    import orjson  # ~3-6x faster than stdlib json for large payloads
+except ImportError:
+    orjson = None
+
 from src.sources.base import SkillSource, SkillSearchResult
 
 logger = logging.getLogger(__name__)
@@ -27,18 +34,36 @@ class SkillsShSource:
     REGISTRY_NAME = "skills.sh"
     DEFAULT_BASE_URL = "https://skills.sh"
     SEARCH_ENDPOINT = "/api/search"
-    
+
+    # Short-lived search cache: sessions repeat the same queries (retries,
+    # add_skill lookups, limit variants), and install counts don't move
+    # fast enough for a 60s window to matter
+    SEARCH_CACHE_TTL = 60.0
+    SEARCH_CACHE_MAX = 256
+
+
     def __init__(
         self,
         base_url: str = DEFAULT_BASE_URL,
         timeout: float = 10.0,
         enabled: bool = True,
+        client: httpx.AsyncClient | None = None,
     ):
         self._base_url = base_url.rstrip("/")
         self._timeout = timeout
         self._enabled = enabled
+        self._external_client = client
         self._client: httpx.AsyncClient | None = None
-    
+        self._headers = {
+            "Accept": "application/json",
+            "User-Agent": "skyll/0.1.0",
+        }
+        # (query, limit) -> (fetched_at, results); LRU order maintained
+        # via move_to_end, bounded at SEARCH_CACHE_MAX
+        self._search_cache: OrderedDict[
+            tuple[str, int], tuple[float, list[SkillSearchResult]]
+        ] = OrderedDict()
+
     @property
     def name(self) -> str:
         return self.REGISTRY_NAME
@@ -48,20 +73,17 @@ class SkillsShSource:
         return self._enabled
     
     async def __aenter__(self) -> "SkillsShSource":
-        self._client = httpx.AsyncClient(
-            base_url=self._base_url,
-            timeout=self._timeout,
-            headers={
-                "Accept": "application/json",
-                "User-Agent": "skyll/0.1.0",
-            },
-        )
+        if self._external_client is not None:
+            # Shared client: caller owns its lifecycle and pool limits
+            self._client = self._external_client
+        else:
+            self._client = httpx.AsyncClient(timeout=self._timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._client:
+        if self._client and self._external_client is None:
             await self._client.aclose()
-            self._client = None
+        self._client = None
     
     @property
     def client(self) -> httpx.AsyncClient:
@@ -73,14 +95,28 @@ class SkillsShSource:
         """Search skills.sh for matching skills."""
         if not self._enabled:
             return []
-        
+
+        cache_key = (query.strip().lower(), limit)
+        cached = self._search_cache.get(cache_key)
+        if cached is not None:
+            fetched_at, results = cached
+            if time.monotonic() - fetched_at < self.SEARCH_CACHE_TTL:
+                self._search_cache.move_to_end(cache_key)
+                logger.debug(f"skills.sh cache hit for '{query}'")
+                return list(results)
+            del self._search_cache[cache_key]
+
         try:
             response = await self.client.get(
-                self.SEARCH_ENDPOINT,
+                f"{self._base_url}{self.SEARCH_ENDPOINT}",
                 params={"q": query, "limit": limit},
+                headers=self._headers,
             )
             response.raise_for_status()
-            data = response.json()
+            if orjson:
+                data = orjson.loads(response.content)
+            else:
+                data = response.json()
             
             results = []
             for skill in data.get("skills", []):
@@ -102,6 +138,10 @@ class SkillsShSource:
                     )
                 )
             
+            self._search_cache[cache_key] = (time.monotonic(), results)
+            if len(self._search_cache) > self.SEARCH_CACHE_MAX:
+                self._search_cache.popitem(last=False)
+
             logger.debug(f"skills.sh: '{query}' returned {len(results)} results")
             return results
             
@@ -1,6 +1,5 @@
 """Tests for cache backends."""
 
-import asyncio
 import pytest
 
 from src.cache.memory import InMemoryCache
@@ -66,15 +65,19 @@ class TestInMemoryCache:
         assert await cache.get("key2") is None
 
     @pytest.mark.asyncio
-    async def test_expiration(self, cache):
+    async def test_expiration(self, cache, monkeypatch):
         """Test that expired keys are not returned."""
-        # Set with very short TTL
+        # ttl=0 means no expiry
         await cache.set("short", "value", ttl=0)
+        assert await cache.get("short") == "value"
+
+        # Drive the cache's clock directly instead of sleeping past the TTL
+        now = [0.0]
+        monkeypatch.setattr("src.cache.memory.time.monotonic", lambda: now[0])
 
-        # Should be expired immediately (ttl=0 means no expiry, use 1)
         cache2 = InMemoryCache(default_ttl=60)
         await cache2.set("short", "value", ttl=1)
-        await asyncio.sleep(1.1)
+        now[0] += 2.0
 
         result = await cache2.get("short")
         assert result is None
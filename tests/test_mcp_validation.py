@@ -138,3 +138,128 @@ class TestGetSkillValidation:
             # Should not be a format error
             assert "format" not in result["error"].lower()
             assert "owner/repo" not in result["error"].lower()
+
+
+class TestBatchExecuteValidation:
+    """Test batch_execute input validation and dedup fan-out."""
+
+    @pytest.mark.asyncio
+    async def test_empty_operations_returns_error(self):
+        """Empty operations list should return clear error."""
+        from src.mcp_server import batch_execute
+
+        result = await batch_execute(operations=[])
+        assert "error" in result
+        assert "empty" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_too_many_operations_returns_error(self):
+        """Batches over the size cap should return clear error."""
+        from src.mcp_server import batch_execute, MAX_BATCH_OPERATIONS
+
+        ops = [
+            {"tool": "search_skills", "args": {"query": "test"}}
+            for _ in range(MAX_BATCH_OPERATIONS + 1)
+        ]
+        result = await batch_execute(operations=ops)
+        assert "error" in result
+        assert "too many" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_returns_per_op_error(self):
+        """Unknown tool should fail its own entry, not the whole batch."""
+        from src.mcp_server import batch_execute
+
+        result = await batch_execute(operations=[{"tool": "not_a_tool", "id": "z"}])
+        assert result["count"] == 1
+        entry = result["results"][0]
+        assert entry["id"] == "z"
+        assert "unknown tool" in entry["result"]["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_non_dict_args_returns_per_op_error(self):
+        """String/list args should surface a structured error, not raise."""
+        from src.mcp_server import batch_execute
+
+        result = await batch_execute(
+            operations=[{"tool": "search_skills", "args": "react"}]
+        )
+        entry = result["results"][0]
+        assert "error" in entry["result"]
+        assert "expected an object" in entry["result"]["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_non_dict_operation_returns_per_op_error(self):
+        """A non-dict operation should surface a structured error, not raise."""
+        from src.mcp_server import batch_execute
+
+        result = await batch_execute(operations=["search_skills"])
+        entry = result["results"][0]
+        assert "error" in entry["result"]
+
+    @pytest.mark.asyncio
+    async def test_duplicate_operations_run_once_with_ids_echoed(self, monkeypatch):
+        """Identical tool+args run once; every entry keeps its own id."""
+        import src.mcp_server as mcp_server
+
+        calls = []
+
+        async def fake_tool(**kwargs):
+            calls.append(kwargs)
+            return {"ok": True}
+
+        monkeypatch.setitem(mcp_server._BATCH_TOOLS, "fake_tool", fake_tool)
+        result = await mcp_server.batch_execute(
+            operations=[
+                {"tool": "fake_tool", "args": {"query": "react"}, "id": "a"},
+                {"tool": "fake_tool", "args": {"query": "react"}, "id": "b"},
+            ]
+        )
+        assert len(calls) == 1
+        assert result["count"] == 2
+        assert [entry["id"] for entry in result["results"]] == ["a", "b"]
+        assert all(entry["result"] == {"ok": True} for entry in result["results"])
+
+
+class TestGetSkillsValidation:
+    """Test get_skills input validation."""
+
+    @pytest.mark.asyncio
+    async def test_empty_skill_ids_returns_error(self):
+        """Empty skill_ids list should return clear error."""
+        from src.mcp_server import get_skills
+
+        result = await get_skills(source="owner/repo", skill_ids=[])
+        assert "error" in result
+        assert "empty" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_empty_source_returns_error(self):
+        """Empty source should return clear error."""
+        from src.mcp_server import get_skills
+
+        result = await get_skills(source="", skill_ids=["test-skill"])
+        assert "error" in result
+        assert "empty" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_source_without_slash_returns_error(self):
+        """Source without owner/repo format should return error."""
+        from src.mcp_server import get_skills
+
+        result = await get_skills(source="invalid-source", skill_ids=["test-skill"])
+        assert "error" in result
+        assert "format" in result["error"].lower() or "owner/repo" in result["error"].lower()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_collapse_case_insensitively(self):
+        """Case-insensitive duplicate ids collapse to the first-seen casing."""
+        from src.mcp_server import get_skills
+
+        result = await get_skills(
+            source="owner/repo", skill_ids=["My-Skill", "my-skill", "other"]
+        )
+        # Per-skill fetches fail without a service, but the response shape
+        # and the dedup are decided before any fetch happens
+        assert result["source"] == "owner/repo"
+        assert set(result["skills"]) == {"My-Skill", "other"}
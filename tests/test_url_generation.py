@@ -65,28 +65,29 @@ class TestGitHubUrlGeneration:
         assert "skills.sh" in url
         assert "//" not in url.replace("https://", "")  # No double slashes
 
-    def test_no_double_slashes_in_any_url(self):
-        """Verify no double slashes in URLs for various inputs."""
-        client = GitHubClient()
-
-        test_cases = [
+    @pytest.mark.parametrize(
+        "source,skill_id",
+        [
             ("owner/repo", "skill"),
             ("", "owner/repo/skill"),
             ("", "skill"),
             ("owner/repo", ""),
             ("a/b", "c/d/e"),
-        ]
+        ],
+    )
+    def test_no_double_slashes_in_url(self, source, skill_id):
+        """Verify no double slashes in URLs for various inputs."""
+        client = GitHubClient()
 
-        for source, skill_id in test_cases:
-            github_url = client.get_github_url(source, skill_id)
-            skills_url = client.get_skills_sh_url(source, skill_id)
+        github_url = client.get_github_url(source, skill_id)
+        skills_url = client.get_skills_sh_url(source, skill_id)
 
-            # Remove https:// and check for double slashes
-            github_path = github_url.replace("https://", "")
-            skills_path = skills_url.replace("https://", "")
+        # Remove https:// and check for double slashes
+        github_path = github_url.replace("https://", "")
+        skills_path = skills_url.replace("https://", "")
 
-            assert "//" not in github_path, f"Double slash in GitHub URL for source='{source}', skill_id='{skill_id}': {github_url}"
-            assert "//" not in skills_path, f"Double slash in skills.sh URL for source='{source}', skill_id='{skill_id}': {skills_url}"
+        assert "//" not in github_path, f"Double slash in GitHub URL for source='{source}', skill_id='{skill_id}': {github_url}"
+        assert "//" not in skills_path, f"Double slash in skills.sh URL for source='{source}', skill_id='{skill_id}': {skills_url}"
 
 
 class TestSkillsShSourceExtraction: